@@ -7,6 +7,9 @@ class Database:
     def change_version_and_compile(self, revision_or_path: str = None):
         pass
 
+    def close_connection(self):
+        pass
+
     def destroy(self):
         pass
 
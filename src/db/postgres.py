@@ -6,6 +6,7 @@ from enum import Enum
 from typing import List, Type
 
 import psycopg2
+from psycopg2.pool import ThreadedConnectionPool
 from allpairspy import AllPairs
 
 from config import Config, ConnectionConfig
@@ -17,6 +18,9 @@ from utils import evaluate_sql, allowed_diff
 DEFAULT_USERNAME = 'postgres'
 DEFAULT_PASSWORD = 'postgres'
 
+CONNECTION_POOL_MIN_SIZE = 1
+CONNECTION_POOL_MAX_SIZE = 8
+
 ENABLE_PLAN_HINTING = "SET pg_hint_plan.enable_hint = ON;"
 ENABLE_DEBUG_HINTING = "SET pg_hint_plan.debug_print = ON;"
 CLIENT_MESSAGES_TO_LOG = "SET client_min_messages TO log;"
@@ -43,10 +47,18 @@ class Postgres(Database):
             self.config.connection.username,
             self.config.connection.password,
             database, )
-        self.connection = Connection(config)
 
+        # connections to previous database or server instance can't be reused
+        self.close_connection()
+
+        self.connection = Connection(config)
         self.connection.connect()
 
+    def close_connection(self):
+        if self.connection:
+            self.connection.close()
+            self.connection = None
+
     def get_list_optimizations(self, original_query):
         return PGListOfOptimizations(
             self.config, original_query).get_all_optimizations()
@@ -63,18 +75,40 @@ class Postgres(Database):
 
 class Connection:
     conn = None
+    pool = None
+    pool_size = CONNECTION_POOL_MAX_SIZE
 
     def __init__(self, connection_config):
         self.connection_config = connection_config
 
     def connect(self):
-        self.conn = psycopg2.connect(
-            host=self.connection_config.host,
-            port=self.connection_config.port,
-            database=self.connection_config.database,
-            user=self.connection_config.username,
-            password=self.connection_config.password)
-        self.conn.autocommit = True
+        if self.pool is None:
+            self.pool = ThreadedConnectionPool(
+                minconn=CONNECTION_POOL_MIN_SIZE,
+                maxconn=self.pool_size,
+                host=self.connection_config.host,
+                port=self.connection_config.port,
+                database=self.connection_config.database,
+                user=self.connection_config.username,
+                password=self.connection_config.password)
+
+        self.conn = self.get_conn()
+
+    def get_conn(self):
+        conn = self.pool.getconn()
+        conn.autocommit = True
+
+        return conn
+
+    def put_conn(self, conn):
+        self.pool.putconn(conn)
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.closeall()
+
+        self.pool = None
+        self.conn = None
 
     def get_version(self):
         with self.conn.cursor() as cur:
@@ -1,10 +1,12 @@
 import dataclasses
+import functools
 import json
 import os
 from typing import List, Dict, Type
 
 from dacite import Config as DaciteConfig
 from dacite import from_dict
+import orjson
 
 from config import Config
 
@@ -153,14 +155,22 @@ class EnhancedJSONEncoder(json.JSONEncoder):
         return super().default(o)
 
 
+@functools.lru_cache(maxsize=32)
+def _load(path, mtime):
+    with open(path, "rb") as prev_result:
+        return orjson.loads(prev_result.read())
+
+
 class ResultsLoader:
 
     def __init__(self):
         self.clazz = ListOfQueries
 
     def get_queries_from_previous_result(self, previous_execution_path):
-        with open(previous_execution_path, "r") as prev_result:
-            return from_dict(self.clazz, json.load(prev_result), DaciteConfig(check_types=False))
+        # dataclasses are built from scratch each time, so reports can't affect each other
+        return from_dict(self.clazz,
+                         _load(previous_execution_path, os.path.getmtime(previous_execution_path)),
+                         DaciteConfig(check_types=False))
 
     def store_queries_to_file(self, queries: Type[ListOfQueries], output_json_name: str):
         if not os.path.isdir("report"):
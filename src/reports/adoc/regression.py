@@ -1,3 +1,5 @@
+from typing import List
+
 from sql_formatter.core import format_sql
 
 from objects import ListOfQueries, Query
@@ -19,11 +21,7 @@ class RegressionReport(Report):
         report.define_version(loq_v1.db_version, loq_v2.db_version)
         report.report_model(loq_v1.model_queries)
 
-        for query in zip(loq_v1.queries, loq_v2.queries):
-            if query[0].query_hash != query[1].query_hash:
-                raise AttributeError("Query hashes are not mathing, check input files")
-
-            report.add_query(*query)
+        report.add_queries_bulk(loq_v1.queries, loq_v2.queries)
 
         report.build_report()
         report.publish_report("reg")
@@ -40,6 +38,15 @@ class RegressionReport(Report):
         else:
             self.queries[first_query.tag].append([first_query, second_query])
 
+    def add_queries_bulk(self, first_queries: List[Query], second_queries: List[Query]):
+        if len(first_queries) != len(second_queries) or any(
+                first_query.query_hash != second_query.query_hash
+                for first_query, second_query in zip(first_queries, second_queries)):
+            raise AttributeError("Query hashes are not mathing, check input files")
+
+        for first_query, second_query in zip(first_queries, second_queries):
+            self.add_query(first_query, second_query)
+
     def build_report(self):
         # link to top
         self.add_plan_comparison()
@@ -1,4 +1,4 @@
-from typing import Type
+from typing import List, Type
 
 from sql_formatter.core import format_sql
 
@@ -18,8 +18,7 @@ class RegressionXlsReport(Report):
     def generate_report(cls, first_loq: ListOfQueries, second_loq: ListOfQueries):
         report = RegressionXlsReport()
 
-        for qid, query in enumerate(first_loq.queries):
-            report.add_query(query, second_loq.queries[qid])
+        report.add_queries_bulk(first_loq.queries, second_loq.queries)
 
         report.build_report()
 
@@ -35,6 +34,14 @@ class RegressionXlsReport(Report):
         else:
             self.queries[query.tag].append([query, pg])
 
+    def add_queries_bulk(self, queries: List[Type[Query]], pg_queries: List[Type[Query]]):
+        if len(queries) != len(pg_queries) or any(
+                query.query_hash != pg.query_hash for query, pg in zip(queries, pg_queries)):
+            raise AttributeError("Query hashes are not mathing, check input files")
+
+        for query, pg in zip(queries, pg_queries):
+            self.add_query(query, pg)
+
     def build_report(self):
         import xlsxwriter
 
@@ -1,40 +1,86 @@
 import argparse
+import hashlib
+import os
+import pickle
+import re
+import tempfile
 
 from pyhocon import ConfigFactory
 
 from config import Config, init_logger, ConnectionConfig, DDLStep
 from db.factory import create_database
 from db.postgres import DEFAULT_USERNAME, DEFAULT_PASSWORD, PostgresResultsLoader
-from reports.adoc.comparison import ComparisonReport
-from reports.adoc.regression import RegressionReport
-from reports.adoc.score import ScoreReport
-from reports.xls.score import ScoreXlsReport
-from reports.xls.regression import RegressionXlsReport
-from reports.adoc.selectivity import SelectivityReport
-from reports.adoc.taqo import TaqoReport
-
-from scenario import Scenario
 from utils import get_bool_from_str
 
+HOCON_CACHE_DIR = os.path.expanduser("~/.cache/taqo")
+HOCON_CACHE_FORMAT = "plain-dict-v2"
+HOCON_INCLUDE_REGEX = r"(^|[{,])\s*include\s"
 
-def parse_ddls(ddl_ops):
-    result = set()
+_DDL_MAP = {
+    "database": DDLStep.DATABASE,
+    "create": DDLStep.CREATE,
+    "import": DDLStep.IMPORT,
+    "drop": DDLStep.DROP,
+    "analyze": DDLStep.ANALYZE,
+}
+
+
+def parse_hocon(path):
+    # plain dict lookups are cheaper than walking HOCON tree for every option
+    return dict(ConfigFactory.parse_file(path).as_plain_ordered_dict())
+
+
+def load_cached_hocon(path):
+    stat = os.stat(path)
+    file_state = (stat.st_mtime_ns, stat.st_size)
+
+    with open(path, "r") as config_file:
+        config_content = config_file.read()
+
+    # result of includes and substitutions depends on other files and environment,
+    # which is not covered by the cache key, so such configs are always parsed
+    if re.search(HOCON_INCLUDE_REGEX, config_content, re.MULTILINE) or "${" in config_content:
+        return parse_hocon(path)
 
-    if ddl_ops == "none":
-        return result
+    # single cache file per config path, so edits overwrite it instead of adding new ones
+    cache_name = f"{os.path.abspath(path)}:{HOCON_CACHE_FORMAT}"
+    cache_path = f"{HOCON_CACHE_DIR}/{hashlib.sha1(cache_name.encode('utf-8')).hexdigest()}.pkl"
 
-    if "database" in ddl_ops:
-        result.add(DDLStep.DATABASE)
-    if "create" in ddl_ops:
-        result.add(DDLStep.CREATE)
-    if "import" in ddl_ops:
-        result.add(DDLStep.IMPORT)
-    if "drop" in ddl_ops:
-        result.add(DDLStep.DROP)
-    if "analyze" in ddl_ops:
-        result.add(DDLStep.ANALYZE)
+    if os.path.isfile(cache_path):
+        try:
+            with open(cache_path, "rb") as cache_file:
+                cached_state, cached_configuration = pickle.load(cache_file)
 
-    return result
+            if cached_state == file_state:
+                return cached_configuration
+        except Exception:
+            # broken cache file - just parse config again
+            pass
+
+    configuration = parse_hocon(path)
+
+    try:
+        os.makedirs(HOCON_CACHE_DIR, exist_ok=True)
+
+        # write to temporary file first, so parallel runs never read partial cache
+        with tempfile.NamedTemporaryFile("wb", dir=HOCON_CACHE_DIR, suffix=".tmp",
+                                         delete=False) as cache_file:
+            pickle.dump((file_state, configuration), cache_file)
+
+        try:
+            os.replace(cache_file.name, cache_path)
+        except OSError:
+            os.remove(cache_file.name)
+    except OSError:
+        pass
+
+    return configuration
+
+
+def parse_ddls(ddl_ops):
+    tokens = {token.strip() for token in ddl_ops.split(",")}
+
+    return {_DDL_MAP[token] for token in tokens & _DDL_MAP.keys()}
 
 
 if __name__ == "__main__":
@@ -134,7 +180,7 @@ if __name__ == "__main__":
                         help='Build yb_build with --clean-force flag')
 
     parser.add_argument('--num-nodes',
-                        default=0,
+                        default=None,
                         help='Number of nodes')
 
     parser.add_argument('--tserver-flags',
@@ -194,14 +240,15 @@ if __name__ == "__main__":
 
     args = parser.parse_args()
 
-    configuration = ConfigFactory.parse_file(args.config)
+    configuration = load_cached_hocon(args.config)
     ddls = parse_ddls(args.ddls)
+    num_queries = int(args.num_queries)
 
     config = Config(
         logger=init_logger("DEBUG" if args.verbose else "INFO"),
 
         source_path=args.source_path or configuration.get("source-path", None),
-        num_nodes=int(args.num_nodes) or configuration.get("num-nodes", 3),
+        num_nodes=int(args.num_nodes) if args.num_nodes is not None else configuration.get("num-nodes", 3),
 
         revision=args.revision or None,
         tserver_flags=args.tserver_flags,
@@ -237,8 +284,7 @@ if __name__ == "__main__":
         look_near_best_plan=configuration.get("look-near-best-plan", True),
         all_pairs_threshold=configuration.get("all-pairs-threshold", 3),
 
-        num_queries=int(args.num_queries)
-        if int(args.num_queries) > 0 else configuration.get("num-queries", -1),
+        num_queries=num_queries if num_queries > 0 else configuration.get("num-queries", -1),
         num_retries=configuration.get("num-retries", 5),
         num_warmup=configuration.get("num-warmup", 2),
 
@@ -270,6 +316,9 @@ if __name__ == "__main__":
         if not args.yes:
             input("Validate configuration carefully and press Enter...")
 
+        # scenario pulls in model and SQL parsing dependencies only needed for collect
+        from scenario import Scenario
+
         config.logger.info("Evaluating scenario")
         sc = Scenario(config)
         sc.evaluate()
@@ -279,25 +328,34 @@ if __name__ == "__main__":
         config.logger.info(f"Allowed execution time percentage deviation: {config.skip_percentage_delta * 100}%")
         config.logger.info("------------------------------------------------------------")
 
+        # report backends are imported on demand, only one of them is used per run
         if args.type == "taqo":
+            from reports.adoc.taqo import TaqoReport
+
             yb_queries = loader.get_queries_from_previous_result(args.results)
             pg_queries = loader.get_queries_from_previous_result(
                 args.pg_results) if args.pg_results else None
 
             TaqoReport.generate_report(yb_queries, pg_queries)
         elif args.type == "score":
+            from reports.adoc.score import ScoreReport
+
             yb_queries = loader.get_queries_from_previous_result(args.results)
             pg_queries = loader.get_queries_from_previous_result(
                 args.pg_results) if args.pg_results else None
 
             ScoreReport.generate_report(yb_queries, pg_queries)
         elif args.type == "score_xls":
+            from reports.xls.score import ScoreXlsReport
+
             yb_queries = loader.get_queries_from_previous_result(args.results)
             pg_queries = loader.get_queries_from_previous_result(
                 args.pg_results) if args.pg_results else None
 
             ScoreXlsReport.generate_report(yb_queries, pg_queries)
         elif args.type == "regression":
+            from reports.adoc.regression import RegressionReport
+
             report = RegressionReport()
 
             v1_queries = loader.get_queries_from_previous_result(args.v1_results)
@@ -305,6 +363,8 @@ if __name__ == "__main__":
 
             report.generate_report(v1_queries, v2_queries)
         elif args.type == "regression_xls":
+            from reports.xls.regression import RegressionXlsReport
+
             report = RegressionXlsReport()
 
             v1_queries = loader.get_queries_from_previous_result(args.v1_results)
@@ -312,6 +372,8 @@ if __name__ == "__main__":
 
             report.generate_report(v1_queries, v2_queries)
         elif args.type == "comparison":
+            from reports.adoc.comparison import ComparisonReport
+
             report = ComparisonReport()
 
             yb_queries = loader.get_queries_from_previous_result(args.results)
@@ -320,6 +382,8 @@ if __name__ == "__main__":
 
             report.generate_report(yb_queries, pg_queries)
         elif args.type == "selectivity":
+            from reports.adoc.selectivity import SelectivityReport
+
             report = SelectivityReport()
 
             default_queries = loader.get_queries_from_previous_result(args.default_results)
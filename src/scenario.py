@@ -1,12 +1,17 @@
+import itertools
+import logging
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 
 import psycopg2
+import sqlparse
 from tqdm import tqdm
 
 from config import DDLStep
 from db.yugabyte import ENABLE_STATISTICS_HINT
 from models.factory import get_test_model
-from utils import evaluate_sql, calculate_avg_execution_time, get_md5
+from utils import evaluate_sql, calculate_avg_execution_time, get_md5, get_plan_str, \
+    query_with_analyze
 
 
 class Scenario:
@@ -14,6 +19,7 @@ class Scenario:
         self.config = config
         self.logger = self.config.logger
         self.sut_database = self.config.database
+        self.num_retries = int(self.config.num_retries)
 
     def start_db(self):
         self.logger.info(f"Initializing {self.sut_database.__class__.__name__} DB")
@@ -62,6 +68,8 @@ class Scenario:
             self.logger.exception(e)
             raise e
         finally:
+            self.sut_database.close_connection()
+
             if self.config.clean_db:
                 self.stop_db()
 
@@ -95,38 +103,72 @@ class Scenario:
         return model_queries, queries
 
     def evaluate_testing_queries(self, conn, queries, evaluate_optimizations):
-        counter = 1
-        for original_query in queries:
-            with conn.cursor() as cur:
-                for query in self.config.session_props:
-                    evaluate_sql(cur, query)
+        progress = itertools.count(1)
 
-                if self.config.enable_statistics:
-                    self.logger.debug("Enable yb_enable_optimizer_statistics flag")
+        # plans only mode w/o analyze doesn't measure execution time,
+        # so queries can be explained concurrently without affecting the results
+        if self.config.plans_only and not evaluate_optimizations and len(queries) > 1 and \
+                not query_with_analyze(self.config.explain_clause.lower()):
+            self.evaluate_testing_queries_in_parallel(queries, progress)
+        else:
+            self.evaluate_queries_chunk(conn, queries, evaluate_optimizations, progress, len(queries))
 
-                    evaluate_sql(cur, ENABLE_STATISTICS_HINT)
+    def evaluate_testing_queries_in_parallel(self, queries, progress):
+        connection = self.sut_database.connection
+        # primary connection is already taken from the pool
+        num_workers = min(connection.pool_size - 1, len(queries))
+        chunks = [queries[worker_id::num_workers] for worker_id in range(num_workers)]
 
-                try:
-                    evaluate_sql(cur,
-                                 f"SET statement_timeout = '{self.config.test_query_timeout}s'")
+        self.logger.info(f"Evaluating execution plans using {num_workers} connections")
 
+        def evaluate_chunk(chunk):
+            conn = connection.get_conn()
+            try:
+                conn.autocommit = False
+                self.evaluate_queries_chunk(conn, chunk, False, progress, len(queries))
+            finally:
+                try:
+                    # dead connection can't be rolled back, keep the original error instead
+                    if not conn.closed:
+                        conn.rollback()
+                finally:
+                    connection.put_conn(conn)
+
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            list(executor.map(evaluate_chunk, chunks))
+
+    def evaluate_queries_chunk(self, conn, queries, evaluate_optimizations, progress, num_queries):
+        session_setup_queries = self.get_session_setup_queries()
+        session_setup_sql = ";\n".join(session_setup_queries) + ";"
+        # single cursor is reused for all queries, rollback doesn't invalidate it
+        with conn.cursor() as cur:
+            for original_query in queries:
+                # combined script is logged as a single cut line, so show each setting
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    for setup_query in session_setup_queries:
+                        self.logger.debug(setup_query)
+
+                # session settings are rolled back with each query transaction,
+                # so send them all again in a single round trip
+                evaluate_sql(cur, session_setup_sql)
+
+                counter = next(progress)
+                try:
                     short_query = original_query.query.replace('\n', '')[:40]
                     self.logger.info(
-                        f"Evaluating query {short_query}... [{counter}/{len(queries)}]")
+                        f"Evaluating query {short_query}... [{counter}/{num_queries}]")
 
                     try:
                         evaluate_sql(cur, original_query.get_explain())
                         original_query.execution_plan = self.config.database.get_execution_plan(
-                            '\n'.join(
-                                str(item[0]) for item in cur.fetchall()))
+                            get_plan_str(cur))
 
                         conn.rollback()
                     except psycopg2.errors.QueryCanceled:
                         try:
                             evaluate_sql(cur, original_query.get_heuristic_explain())
                             original_query.execution_plan = self.config.database.get_execution_plan(
-                                '\n'.join(
-                                    str(item[0]) for item in cur.fetchall()))
+                                get_plan_str(cur))
 
                             conn.rollback()
                         except psycopg2.errors.QueryCanceled:
@@ -139,7 +181,7 @@ class Scenario:
                             original_query.execution_plan.get_estimated_cost()
                     else:
                         calculate_avg_execution_time(cur, original_query,
-                                                     num_retries=int(self.config.num_retries),
+                                                     num_retries=self.num_retries,
                                                      connection=conn)
 
                     if evaluate_optimizations and "dml" not in original_query.optimizer_tips.tags:
@@ -152,10 +194,23 @@ class Scenario:
                 except Exception as e:
                     self.logger.info(original_query)
                     raise e
-                finally:
-                    counter += 1
 
-            conn.rollback()
+                conn.rollback()
+
+    def get_session_setup_queries(self):
+        # drop trailing comments and semicolons, so props can be joined into one script
+        setup_queries = [clean_query for clean_query in (
+            sqlparse.format(query, strip_comments=True).strip().rstrip(";").strip()
+            for query in self.config.session_props) if clean_query]
+
+        if self.config.enable_statistics:
+            self.logger.debug("Enable yb_enable_optimizer_statistics flag")
+
+            setup_queries.append(ENABLE_STATISTICS_HINT.rstrip(";"))
+
+        setup_queries.append(f"SET statement_timeout = '{self.config.test_query_timeout}s'")
+
+        return setup_queries
 
     def evaluate_optimizations(self, connection, cur, original_query):
         # build all possible optimizations
@@ -191,8 +246,7 @@ class Scenario:
             try:
                 evaluate_sql(cur, optimization.get_explain())
                 optimization.execution_plan = database.get_execution_plan(
-                    '\n'.join(
-                        str(item[0]) for item in cur.fetchall()))
+                    get_plan_str(cur))
 
                 connection.rollback()
             except psycopg2.errors.QueryCanceled as e:
@@ -214,7 +268,7 @@ class Scenario:
             elif not_unique_plan or not calculate_avg_execution_time(
                     cur,
                     optimization,
-                    num_retries=int(self.config.num_retries),
+                    num_retries=self.num_retries,
                     connection=connection):
                 num_skipped += 1
 
@@ -233,8 +287,7 @@ class Scenario:
             if self.config.enable_statistics or optimization.execution_plan is None:
                 evaluate_sql(cur, optimization.get_heuristic_explain())
 
-                execution_plan = self.config.database.get_execution_plan('\n'.join(
-                    str(item[0]) for item in cur.fetchall()))
+                execution_plan = self.config.database.get_execution_plan(get_plan_str(cur))
             else:
                 execution_plan = optimization.execution_plan
 
@@ -1,4 +1,5 @@
 import hashlib
+import logging
 import re
 import time
 from copy import copy
@@ -42,6 +43,11 @@ def get_result(cur, is_dml):
     return cardinality, str_result
 
 
+def get_plan_str(cur):
+    # iterate cursor directly instead of building intermediate fetchall() list
+    return "\n".join(str(row[0]) for row in cur)
+
+
 def calculate_avg_execution_time(cur,
                                  query: Query,
                                  query_str: str = None,
@@ -170,8 +176,10 @@ def evaluate_sql(cur, sql):
 
     parameters, sql, sql_wo_parameters = parse_clear_and_parametrized_sql(sql)
 
-    config.logger.debug(
-        sql.replace("\n", "")[:120] + "..." if len(sql) > 120 else sql.replace("\n", ""))
+    # skip building log line for every statement if it won't be written anyway
+    if config.logger.isEnabledFor(logging.DEBUG):
+        config.logger.debug(
+            sql.replace("\n", "")[:120] + "..." if len(sql) > 120 else sql.replace("\n", ""))
 
     if config.parametrized and parameters:
         try: